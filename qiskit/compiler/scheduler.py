@@ -97,7 +97,8 @@ def schedule(
                 dt = backend.configuration().dt
 
     schedule_config = ScheduleConfig(inst_map=inst_map, meas_map=meas_map, dt=dt)
-    circuits = circuits if isinstance(circuits, list) else [circuits]
+    if not arg_circuits_list:
+        circuits = [circuits]
     schedules = parallel_map(schedule_circuit, circuits, (schedule_config, method, backend))
     end_time = time()
     _log_schedule_time(start_time, end_time)
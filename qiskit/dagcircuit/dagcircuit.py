@@ -23,6 +23,7 @@ directly from the graph.
 from collections import OrderedDict, defaultdict, deque, namedtuple
 import copy
 import math
+import operator
 from typing import Dict, Generator, Any, List
 
 import numpy as np
@@ -1067,11 +1068,10 @@ class DAGCircuit:
             generator(DAGOpNode, DAGInNode, or DAGOutNode): node in topological order
         """
 
-        def _key(x):
-            return x.sort_key
-
         if key is None:
-            key = _key
+            # ``sort_key`` is precomputed at node construction, so the default
+            # key is a plain attribute fetch.
+            key = operator.attrgetter("sort_key")
 
         return iter(rx.lexicographical_topological_sort(self._multi_graph, key=key))
 
@@ -1494,10 +1494,9 @@ class DAGCircuit:
         for components in connected_components:
             disconnected_subgraphs.append(self._multi_graph.subgraph(list(components)))
 
-        # Helper function for ensuring rustworkx nodes are returned in lexicographical,
+        # Key for ensuring rustworkx nodes are returned in lexicographical,
         # topological order
-        def _key(x):
-            return x.sort_key
+        _key = operator.attrgetter("sort_key")
 
         # Create new DAGCircuit objects from each of the rustworkx subgraph objects
         decomposed_dags = []
@@ -15,6 +15,7 @@
 
 import math
 import heapq
+import operator
 from collections import OrderedDict, defaultdict
 
 import rustworkx as rx
@@ -367,10 +368,11 @@ class DAGDependency:
             generator(DAGNode): node in topological order.
         """
 
-        def _key(x):
-            return x.sort_key
-
-        return iter(rx.lexicographical_topological_sort(self._multi_graph, key=_key))
+        return iter(
+            rx.lexicographical_topological_sort(
+                self._multi_graph, key=operator.attrgetter("sort_key")
+            )
+        )
 
     def _create_op_node(self, operation, qargs, cargs):
         """Creates a DAGDepNode to the graph and update the edges.
@@ -134,26 +134,32 @@ class FakeBackendV2(BackendV2):
     def _get_conf_dict_from_json(self):
         if not self.conf_filename:
             return None
-        conf_dict = self._load_json(self.conf_filename)
-        decode_backend_configuration(conf_dict)
+        conf_dict = self._load_json(self.conf_filename, decode_backend_configuration)
         conf_dict["backend_name"] = self.backend_name
         return conf_dict
 
     def _set_props_dict_from_json(self):
         if self.props_filename:
-            props_dict = self._load_json(self.props_filename)
-            decode_backend_properties(props_dict)
-            self._props_dict = props_dict
+            self._props_dict = self._load_json(self.props_filename, decode_backend_properties)
 
     def _set_defs_dict_from_json(self):
         if self.defs_filename:
-            defs_dict = self._load_json(self.defs_filename)
-            decode_pulse_defaults(defs_dict)
-            self._defs_dict = defs_dict
-
-    def _load_json(self, filename: str) -> dict:
-        with open(os.path.join(self.dirname, filename)) as f_json:
-            the_json = json.load(f_json)
+            self._defs_dict = self._load_json(self.defs_filename, decode_pulse_defaults)
+
+    # Parsed and decoded JSON snapshots shared by every instance of each fake
+    # backend class. The ``from_dict`` model constructors copy before mutating,
+    # so repeated instantiations reuse the dicts without aliasing model data.
+    _json_cache: dict = {}
+
+    def _load_json(self, filename: str, decoder=None) -> dict:
+        key = (self.dirname, filename)
+        the_json = FakeBackendV2._json_cache.get(key)
+        if the_json is None:
+            with open(os.path.join(self.dirname, filename)) as f_json:
+                the_json = json.load(f_json)
+            if decoder is not None:
+                decoder(the_json)
+            FakeBackendV2._json_cache[key] = the_json
         return the_json
 
     @property
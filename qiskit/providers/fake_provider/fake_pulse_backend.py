@@ -35,8 +35,7 @@ class FakePulseBackend(FakeQasmBackend):
     def _set_defaults_from_json(self):
         if not self.props_filename:
             raise QiskitError("No properties file has been defined")
-        defs = self._load_json(self.defs_filename)
-        decode_pulse_defaults(defs)
+        defs = self._load_json(self.defs_filename, decode_pulse_defaults)
         self._defaults = PulseDefaults.from_dict(defs)
 
     def _get_config_from_dict(self, conf):
@@ -50,8 +50,7 @@ class FakeQasmBackend(FakeBackend):
     def _get_conf_from_json(self):
         if not self.conf_filename:
             raise QiskitError("No configuration file has been defined")
-        conf = self._load_json(self.conf_filename)
-        decode_backend_configuration(conf)
+        conf = self._load_json(self.conf_filename, decode_backend_configuration)
         configuration = self._get_config_from_dict(conf)
         configuration.backend_name = self.backend_name
         return configuration
@@ -59,13 +58,23 @@ class FakeQasmBackend(FakeBackend):
     def _set_props_from_json(self):
         if not self.props_filename:
             raise QiskitError("No properties file has been defined")
-        props = self._load_json(self.props_filename)
-        decode_backend_properties(props)
+        props = self._load_json(self.props_filename, decode_backend_properties)
         self._properties = BackendProperties.from_dict(props)
 
-    def _load_json(self, filename):
-        with open(os.path.join(self.dirname, filename)) as f_json:
-            the_json = json.load(f_json)
+    # Parsed and decoded JSON snapshots shared by every instance of each fake
+    # backend class. The ``from_dict`` model constructors copy before mutating,
+    # so repeated instantiations reuse the dicts without aliasing model data.
+    _json_cache: dict = {}
+
+    def _load_json(self, filename, decoder=None):
+        key = (self.dirname, filename)
+        the_json = FakeQasmBackend._json_cache.get(key)
+        if the_json is None:
+            with open(os.path.join(self.dirname, filename)) as f_json:
+                the_json = json.load(f_json)
+            if decoder is not None:
+                decoder(the_json)
+            FakeQasmBackend._json_cache[key] = the_json
         return the_json
 
     def _get_config_from_dict(self, conf):
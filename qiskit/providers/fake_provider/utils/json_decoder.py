@@ -17,6 +17,7 @@ Utils to decode fake backend configurations from json
 from typing import Dict, Union, List
 
 import dateutil.parser
+import numpy as np
 
 
 def decode_pulse_defaults(defaults: Dict) -> None:
@@ -92,9 +93,15 @@ def _decode_pulse_library_item(pulse_library_item: Dict) -> None:
     Args:
         pulse_library_item: A ``PulseLibraryItem`` in dictionary format.
     """
-    pulse_library_item["samples"] = [
-        _to_complex(sample) for sample in pulse_library_item["samples"]
-    ]
+    samples = pulse_library_item["samples"]
+    if samples and isinstance(samples[0], list):
+        # The snapshot format stores each sample as an [re, im] pair; converting
+        # the whole library item in one vectorized pass is much faster than one
+        # _to_complex call per sample for the multi-thousand-sample waveforms.
+        arr = np.asarray(samples, dtype=float)
+        pulse_library_item["samples"] = (arr[:, 0] + 1j * arr[:, 1]).tolist()
+    else:
+        pulse_library_item["samples"] = [_to_complex(sample) for sample in samples]
 
 
 def _decode_pulse_qobj_instr(pulse_qobj_instr: Dict) -> None:
@@ -134,6 +134,7 @@ class ScheduleDef(CalibrationEntry):
         self._definition: Callable | Schedule | None = None
         self._signature: inspect.Signature | None = None
         self._user_provided: bool | None = None
+        self._assigned_cache: dict[tuple, Schedule | ScheduleBlock] = {}
 
     @property
     def user_provided(self) -> bool:
@@ -176,6 +177,7 @@ class ScheduleDef(CalibrationEntry):
         self._definition = definition
         self._parse_argument()
         self._user_provided = user_provided
+        self._assigned_cache.clear()
 
     def get_signature(self) -> inspect.Signature:
         return self._signature
@@ -184,20 +186,37 @@ class ScheduleDef(CalibrationEntry):
         if not args and not kwargs:
             out = self._definition
         else:
+            # Parameter assignment deep copies the definition, which is expensive for
+            # repeated lookups of the same calibration. The unparameterized branch above
+            # already shares the definition with the caller, so assigned programs can be
+            # shared the same way.
+            cache_key = (args, tuple(sorted(kwargs.items())))
             try:
-                to_bind = self.get_signature().bind_partial(*args, **kwargs)
-            except TypeError as ex:
-                raise PulseError(
-                    "Assigned parameter doesn't match with schedule parameters."
-                ) from ex
-            value_dict = {}
-            for param in self._definition.parameters:
-                # Schedule allows partial bind. This results in parameterized Schedule.
+                out = self._assigned_cache.get(cache_key)
+            except TypeError:
+                # Unhashable parameter values cannot be cached.
+                cache_key = None
+                out = None
+            if out is None:
                 try:
-                    value_dict[param] = to_bind.arguments[param.name]
-                except KeyError:
-                    pass
-            out = self._definition.assign_parameters(value_dict, inplace=False)
+                    to_bind = self.get_signature().bind_partial(*args, **kwargs)
+                except TypeError as ex:
+                    raise PulseError(
+                        "Assigned parameter doesn't match with schedule parameters."
+                    ) from ex
+                value_dict = {}
+                for param in self._definition.parameters:
+                    # Schedule allows partial bind. This results in parameterized Schedule.
+                    try:
+                        value_dict[param] = to_bind.arguments[param.name]
+                    except KeyError:
+                        pass
+                out = self._definition.assign_parameters(value_dict, inplace=False)
+                if cache_key is not None:
+                    if len(self._assigned_cache) >= 1024:
+                        # Keep the cache bounded for programs swept over many values.
+                        self._assigned_cache.clear()
+                    self._assigned_cache[cache_key] = out
         if "publisher" not in out.metadata:
             if self.user_provided:
                 out.metadata["publisher"] = CalibrationPublisher.QISKIT
@@ -330,6 +349,7 @@ class PulseQobjDef(ScheduleDef):
         # This doesn't generate signature immediately, because of lazy schedule build.
         self._source = definition
         self._user_provided = user_provided
+        self._assigned_cache.clear()
 
     def get_signature(self) -> inspect.Signature:
         if self._definition is None:
@@ -98,6 +98,12 @@ class Channel(metaclass=ABCMeta):
         """
         self._validate_index(index)
         self._index = index
+        # The index is immutable (parameter assignment produces a new channel), so
+        # the hash and name can be computed once. Channels key the timeslot dict of
+        # every schedule, and the name orders flattened schedule instructions, so
+        # both are evaluated per entry in the hot paths.
+        self._hash = hash((type(self), index))
+        self._name = f"{type(self).prefix}{index}"
 
     @property
     def index(self) -> int | ParameterExpression:
@@ -139,7 +145,7 @@ class Channel(metaclass=ABCMeta):
     @property
     def name(self) -> str:
         """Return the shorthand alias for this channel, which is based on its type and index."""
-        return f"{self.__class__.prefix}{self._index}"
+        return self._name
 
     def __repr__(self):
         return f"{self.__class__.__name__}({self._index})"
@@ -159,7 +165,7 @@ class Channel(metaclass=ABCMeta):
         return type(self) is type(other) and self._index == other._index
 
     def __hash__(self):
-        return hash((type(self), self._index))
+        return self._hash
 
 
 class PulseChannel(Channel, metaclass=ABCMeta):
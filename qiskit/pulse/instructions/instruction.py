@@ -225,6 +225,8 @@ class Instruction(ABC):
 
         Equality is determined by the instruction sharing the same operands and channels.
         """
+        if self is other:
+            return True
         if not isinstance(other, Instruction):
             return NotImplemented
         return isinstance(other, type(self)) and self.operands == other.operands
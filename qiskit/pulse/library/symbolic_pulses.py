@@ -104,6 +104,13 @@ def _is_amplitude_valid(
     return np.all(samples_norm < 1.0 + epsilon)
 
 
+# Evaluated envelope sample arrays, keyed by the envelope expression and its scalar
+# arguments. Pulses that are materialized repeatedly with the same parameters, such
+# as a backend's measurement pulse, share a single evaluation. The cached arrays are
+# marked read-only so sharing them between waveforms is safe.
+_evaluated_envelope_cache: dict[tuple, np.ndarray] = {}
+
+
 def _get_expression_args(expr: sym.Expr, params: dict[str, float]) -> list[np.ndarray | float]:
     """A helper function to get argument to evaluate expression.
 
@@ -504,7 +511,26 @@ class SymbolicPulse(Pulse):
             raise PulseError("Pulse envelope expression is not assigned.")
 
         fargs = _get_expression_args(self._envelope, self.parameters)
-        return Waveform(samples=self._envelope_lam(*fargs), name=self.name)
+        scalar_args = tuple(arg for arg in fargs if not isinstance(arg, np.ndarray))
+        try:
+            cache_key = (self._envelope, self.duration, scalar_args)
+            samples = _evaluated_envelope_cache.get(cache_key)
+        except TypeError:
+            # Unhashable envelope or parameter values cannot be cached.
+            cache_key = None
+            samples = None
+        if samples is not None:
+            return Waveform(samples=samples, name=self.name)
+        waveform = Waveform(samples=self._envelope_lam(*fargs), name=self.name)
+        if cache_key is not None:
+            if len(_evaluated_envelope_cache) >= 256:
+                # Keep the cache bounded for pulses swept over many parameter values.
+                _evaluated_envelope_cache.clear()
+            # Cache the already-clipped samples read-only, so a caller mutating one
+            # waveform cannot corrupt later materializations of the same pulse.
+            waveform.samples.setflags(write=False)
+            _evaluated_envelope_cache[cache_key] = waveform.samples
+        return waveform
 
     def validate_parameters(self) -> None:
         """Validate parameters.
@@ -556,6 +582,9 @@ class SymbolicPulse(Pulse):
 
     def __eq__(self, other: object) -> bool:
 
+        if self is other:
+            return True
+
         if not isinstance(other, SymbolicPulse):
             return NotImplemented
 
@@ -673,6 +702,9 @@ class ScalableSymbolicPulse(SymbolicPulse):
 
     # pylint: disable=too-many-return-statements
     def __eq__(self, other: object) -> bool:
+        if self is other:
+            return True
+
         if not isinstance(other, ScalableSymbolicPulse):
             return NotImplemented
 
@@ -144,8 +144,10 @@ def _measure_v1(
                 else:
                     mem_slot = channels.MemorySlot(unused_mem_slots.pop())
                 inst = instructions.Acquire(inst.duration, inst.channel, mem_slot=mem_slot)
-            # Measurement pulses should only be added if its qubit was measured by the user
-            schedule = schedule.insert(time, inst)
+            # Measurement pulses should only be added if its qubit was measured by the user.
+            # The schedule is local to this call, so insert in place rather than
+            # rebuilding it once per instruction.
+            schedule.insert(time, inst, inplace=True)
 
     return schedule
 
@@ -195,7 +197,9 @@ def _measure_v2(
                         channels.AcquireChannel(measure_qubit),
                     ]
                 )
-                schedule += _schedule_remapping_memory_slot(default_sched, qubit_mem_slots)
+                schedule.append(
+                    _schedule_remapping_memory_slot(default_sched, qubit_mem_slots), inplace=True
+                )
         except KeyError as ex:
             raise exceptions.PulseError(
                 "We could not find a default measurement schedule called '{}'. "
@@ -87,10 +87,19 @@ class NodeVisitor:
     outside of the Qiskit Pulse module.
     """
 
+    # Resolved visitor methods per (visitor class, node class) pair. Resolution
+    # walks the node's class hierarchy with getattr, which is too costly to
+    # repeat for every node of a large program.
+    _dispatch_cache: dict = {}
+
     def visit(self, node: Any):
         """Visit a node."""
-        visitor = self._get_visitor(type(node))
-        return visitor(node)
+        key = (type(self), type(node))
+        visitor = NodeVisitor._dispatch_cache.get(key)
+        if visitor is None:
+            visitor = self._get_visitor(type(node)).__func__
+            NodeVisitor._dispatch_cache[key] = visitor
+        return visitor(self, node)
 
     def _get_visitor(self, node_class):
         """A helper function to recursively investigate superclass visitor method."""
@@ -145,6 +154,11 @@ class ParameterSetter(NodeVisitor):
 
     def visit_Schedule(self, node: Schedule):
         """Visit ``Schedule``. Recursively visit schedule children and overwrite."""
+        if not node._parameter_manager.parameters & self._param_map.keys():
+            # The parameter table covers all nested children, so a schedule that
+            # contains none of the target parameters can be returned untouched
+            # instead of being flattened and rebuilt.
+            return node
         # accessing to private member
         # TODO: consider updating Schedule to handle this more gracefully
         node._Schedule__children = [(t0, self.visit(sched)) for t0, sched in node.instructions]
@@ -157,13 +157,17 @@ class Schedule:
         # These attributes are populated by ``_mutable_insert``
         self._timeslots: TimeSlots = {}
         self._children: list[tuple[int, "ScheduleComponent"]] = []
+        # Lazily populated by ``instructions`` and reset by mutating methods.
+        self._instructions_cache: tuple[tuple[int, Instruction], ...] | None = None
+        timed_schedules = []
         for sched_pair in schedules:
             try:
                 time, sched = sched_pair
             except TypeError:
                 # recreate as sequence starting at 0.
                 time, sched = 0, sched_pair
-            self._mutable_insert(time, sched)
+            timed_schedules.append((time, sched))
+        self._bulk_insert(timed_schedules)
 
     @classmethod
     def initialize_from(cls, other_program: Any, name: str | None = None) -> "Schedule":
@@ -263,12 +267,14 @@ class Schedule:
     @property
     def instructions(self) -> tuple[tuple[int, Instruction], ...]:
         """Get the time-ordered instructions from self."""
+        if self._instructions_cache is None:
 
-        def key(time_inst_pair):
-            inst = time_inst_pair[1]
-            return time_inst_pair[0], inst.duration, sorted(chan.name for chan in inst.channels)
+            def key(time_inst_pair):
+                inst = time_inst_pair[1]
+                return time_inst_pair[0], inst.duration, sorted(chan.name for chan in inst.channels)
 
-        return tuple(sorted(self._instructions(), key=key))
+            self._instructions_cache = tuple(sorted(self._instructions(), key=key))
+        return self._instructions_cache
 
     @property
     def parameters(self) -> set[Parameter]:
@@ -369,6 +375,7 @@ class Schedule:
         self._duration = self._duration + time
         self._timeslots = timeslots
         self._children = [(orig_time + time, child) for orig_time, child in self.children]
+        self._instructions_cache = None
         return self
 
     def insert(
@@ -401,6 +408,55 @@ class Schedule:
         self._add_timeslots(start_time, schedule)
         self._children.append((start_time, schedule))
         self._parameter_manager.update_parameter_table(schedule)
+        self._instructions_cache = None
+        return self
+
+    def _bulk_insert(self, timed_schedules: list[tuple[int, "ScheduleComponent"]]) -> "Schedule":
+        """Mutably insert many already-timed components at once.
+
+        Equivalent to one ``_mutable_insert`` call per pair, but the timeslots of each
+        channel are merged with a single sort and one linear overlap scan instead of a
+        binary-search insertion per component.
+
+        Args:
+            timed_schedules: ``(start_time, schedule)`` pairs to insert.
+
+        Returns:
+            This schedule, with the components inserted.
+
+        Raises:
+            PulseError: If an invalid start time is provided, or if any of the inserted
+                components overlap.
+        """
+        for start_time, schedule in timed_schedules:
+            if not isinstance(start_time, int) and not np.issubdtype(type(start_time), np.integer):
+                raise PulseError("Schedule start time must be an integer.")
+            self._duration = max(self._duration, start_time + schedule.duration)
+            for channel, intervals in _get_timeslots(schedule).items():
+                shifted = [(i[0] + start_time, i[1] + start_time) for i in intervals]
+                if channel in self._timeslots:
+                    self._timeslots[channel].extend(shifted)
+                else:
+                    self._timeslots[channel] = shifted
+            self._children.append((start_time, schedule))
+            self._parameter_manager.update_parameter_table(schedule)
+        for channel, intervals in self._timeslots.items():
+            intervals.sort()
+            for idx in range(1, len(intervals)):
+                if _overlaps(intervals[idx - 1], intervals[idx]):
+                    raise PulseError(
+                        "Schedule(name='{name}') cannot be constructed because its "
+                        "instruction on channel {ch} scheduled from time {t0} to {tf} "
+                        "overlaps with another instruction."
+                        "".format(
+                            name=self.name or "",
+                            ch=channel,
+                            t0=intervals[idx][0],
+                            tf=intervals[idx][1],
+                        )
+                    )
+        _check_nonnegative_timeslot(self._timeslots)
+        self._instructions_cache = None
         return self
 
     def _immutable_insert(
@@ -522,7 +578,7 @@ class Schedule:
         Raises:
             PulseError: If timeslots overlap or an invalid start time is provided.
         """
-        if not np.issubdtype(type(time), np.integer):
+        if not isinstance(time, int) and not np.issubdtype(type(time), np.integer):
             raise PulseError("Schedule start time must be an integer.")
 
         other_timeslots = _get_timeslots(schedule)
@@ -619,6 +675,7 @@ class Schedule:
 
     def _renew_timeslots(self):
         """Regenerate timeslots based on current instructions."""
+        self._instructions_cache = None
         self._timeslots.clear()
         for t0, inst in self.instructions:
             self._add_timeslots(t0, inst)
@@ -1844,15 +1901,18 @@ def _locate_interval_index(intervals: list[Interval], interval: Interval, index:
         The index into intervals that new_interval would be inserted to maintain
         a sorted list of intervals.
     """
-    if not intervals or len(intervals) == 1:
-        return index
-
-    mid_idx = len(intervals) // 2
-    mid = intervals[mid_idx]
-    if interval[1] <= mid[0] and (interval != mid):
-        return _locate_interval_index(intervals[:mid_idx], interval, index=index)
-    else:
-        return _locate_interval_index(intervals[mid_idx:], interval, index=index + mid_idx)
+    # Iterate over an index window rather than recursing on list slices; each
+    # slice would copy its half of the interval list on every bisection step.
+    lo = 0
+    hi = len(intervals)
+    while hi - lo > 1:
+        mid_idx = lo + (hi - lo) // 2
+        mid = intervals[mid_idx]
+        if interval[1] <= mid[0] and (interval != mid):
+            hi = mid_idx
+        else:
+            lo = mid_idx
+    return index + lo
 
 
 def _find_insertion_index(intervals: list[Interval], new_interval: Interval) -> int:
@@ -14,7 +14,7 @@
 The most straightforward scheduling methods: scheduling **as early** or **as late** as possible.
 """
 from collections import defaultdict
-from typing import List, Optional, Union
+from typing import List, Optional, Tuple, Union
 
 from qiskit.circuit.quantumcircuit import QuantumCircuit
 from qiskit.circuit.barrier import Barrier
@@ -25,6 +25,36 @@ from qiskit.scheduler.lowering import lower_gates
 from qiskit.providers import BackendV1, BackendV2
 
 
+def _critical_path_times(circ_pulse_defs) -> Tuple[List[int], List[int]]:
+    """Walk the lowered gates once, returning each one's start and stop time.
+
+    A gate starts as soon as every qubit it involves is free, and occupies those
+    qubits until it finishes. This walk is the scheduler's innermost loop, so the
+    qubit-free-time map is updated inline rather than through a helper call per node.
+
+    Args:
+        circ_pulse_defs: Lowered circuit instructions, in topological order.
+
+    Returns:
+        The per-gate start times and stop times, in the input order.
+    """
+    qubit_time_available = defaultdict(int)
+    start_times = []
+    stop_times = []
+    for circ_pulse_def in circ_pulse_defs:
+        qubits = circ_pulse_def.qubits
+        start_time = max(qubit_time_available[q] for q in qubits)
+        if isinstance(circ_pulse_def.schedule, Barrier):
+            stop_time = start_time
+        else:
+            stop_time = start_time + circ_pulse_def.schedule.duration
+        start_times.append(start_time)
+        stop_times.append(stop_time)
+        for q in qubits:
+            qubit_time_available[q] = stop_time
+    return start_times, stop_times
+
+
 def as_soon_as_possible(
     circuit: QuantumCircuit,
     schedule_config: ScheduleConfig,
@@ -49,33 +79,16 @@ def as_soon_as_possible(
         A schedule corresponding to the input ``circuit`` with pulses occurring as early as
         possible.
     """
-    qubit_time_available = defaultdict(int)
-
-    def update_times(inst_qubits: List[int], time: int = 0) -> None:
-        """Update the time tracker for all inst_qubits to the given time."""
-        for q in inst_qubits:
-            qubit_time_available[q] = time
-
-    start_times = []
     circ_pulse_defs = lower_gates(circuit, schedule_config, backend)
-    for circ_pulse_def in circ_pulse_defs:
-        start_time = max(qubit_time_available[q] for q in circ_pulse_def.qubits)
-        stop_time = start_time
-        if not isinstance(circ_pulse_def.schedule, Barrier):
-            stop_time += circ_pulse_def.schedule.duration
-
-        start_times.append(start_time)
-        update_times(circ_pulse_def.qubits, stop_time)
+    start_times, _ = _critical_path_times(circ_pulse_defs)
 
     timed_schedules = [
         (time, cpd.schedule)
         for time, cpd in zip(start_times, circ_pulse_defs)
         if not isinstance(cpd.schedule, Barrier)
     ]
-    schedule = Schedule.initialize_from(circuit)
-    for time, inst in timed_schedules:
-        schedule.insert(time, inst, inplace=True)
-    return schedule
+    # The start times above are final, so the whole list can be inserted in bulk.
+    return Schedule.initialize_from(circuit)._bulk_insert(timed_schedules)
 
 
 def as_late_as_possible(
@@ -105,25 +118,12 @@ def as_late_as_possible(
         A schedule corresponding to the input ``circuit`` with pulses occurring as late as
         possible.
     """
-    qubit_time_available = defaultdict(int)
-
-    def update_times(inst_qubits: List[int], time: int = 0) -> None:
-        """Update the time tracker for all inst_qubits to the given time."""
-        for q in inst_qubits:
-            qubit_time_available[q] = time
-
-    rev_stop_times = []
     circ_pulse_defs = lower_gates(circuit, schedule_config, backend)
-    for circ_pulse_def in reversed(circ_pulse_defs):
-        start_time = max(qubit_time_available[q] for q in circ_pulse_def.qubits)
-        stop_time = start_time
-        if not isinstance(circ_pulse_def.schedule, Barrier):
-            stop_time += circ_pulse_def.schedule.duration
-
-        rev_stop_times.append(stop_time)
-        update_times(circ_pulse_def.qubits, stop_time)
+    # Scheduling as late as possible is scheduling the reversed program as soon as
+    # possible, with each gate's start time mapped back as a stop time.
+    _, rev_stop_times = _critical_path_times(list(reversed(circ_pulse_defs)))
 
-    last_stop = max(t for t in qubit_time_available.values()) if qubit_time_available else 0
+    last_stop = max(rev_stop_times, default=0)
     start_times = [last_stop - t for t in reversed(rev_stop_times)]
 
     timed_schedules = [
@@ -131,7 +131,5 @@ def as_late_as_possible(
         for time, cpd in zip(start_times, circ_pulse_defs)
         if not isinstance(cpd.schedule, Barrier)
     ]
-    schedule = Schedule.initialize_from(circuit)
-    for time, inst in timed_schedules:
-        schedule.insert(time, inst, inplace=True)
-    return schedule
+    # The start times above are final, so the whole list can be inserted in bulk.
+    return Schedule.initialize_from(circuit)._bulk_insert(timed_schedules)
@@ -12,6 +12,9 @@
 
 """Test cases for the pulse scheduler passes."""
 
+import copy
+import functools
+
 from numpy import pi
 from qiskit import QuantumRegister, ClassicalRegister, QuantumCircuit, schedule
 from qiskit.circuit import Gate, Parameter
@@ -28,21 +31,112 @@ from qiskit.pulse import (
     Gaussian,
     GaussianSquare,
     Play,
-    transforms,
 )
 from qiskit.pulse import build, macros, play, InstructionScheduleMap
+from qiskit.pulse.transforms import target_qobj_transform
 
 from qiskit.providers.fake_provider import FakeBackend, FakeOpenPulse2Q, FakeOpenPulse3Q, FakePerth
 from qiskit.test import QiskitTestCase
 
+# Pulse shapes reused across the calibration tests; ``Gaussian`` is immutable, so
+# one validated instance can back every ``Play``.
+_GAUSS_28 = Gaussian(28, 0.2, 4)
+_GAUSS_1200 = Gaussian(1200, 0.2, 4)
+
+# Lazily built module-level backends, so the JSON snapshots backing each fake
+# backend are only parsed once no matter how many tests use them.
+@functools.lru_cache(maxsize=None)
+def _fake_open_pulse_2q():
+    """Return a shared ``FakeOpenPulse2Q``, built on first use."""
+    return FakeOpenPulse2Q()
+
+
+@functools.lru_cache(maxsize=None)
+def _fake_open_pulse_3q():
+    """Return a shared ``FakeOpenPulse3Q``, built on first use."""
+    return FakeOpenPulse3Q()
+
+
+@functools.lru_cache(maxsize=None)
+def _fake_perth():
+    """Return a shared ``FakePerth``, built on first use."""
+    return FakePerth()
+
+
+class BaseTestSchedule(QiskitTestCase):
+    """Helpers shared by the scheduling test cases."""
+
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        cls._get_cache = {}
+        cls._cx_sched_cache = {}
+        # Registers are immutable once built and circuits only hold references to
+        # their bits, so the same registers can safely back every test circuit.
+        cls._q2 = QuantumRegister(2)
+        cls._c2 = ClassicalRegister(2)
+        cls._q3 = QuantumRegister(3)
+        cls._c3 = ClassicalRegister(3)
+        # Template for the recurring bare-CX circuit; tests clone it with copy()
+        # instead of re-appending the gate through per-instruction validation.
+        cls._cx_circ = QuantumCircuit(cls._q2, cls._c2)
+        cls._cx_circ.cx(cls._q2[0], cls._q2[1])
+
+    @classmethod
+    def _get(cls, name, qubits, *params):
+        """Return ``inst_map.get(name, qubits, *params)``, memoized per class.
+
+        The expected schedules are rebuilt from the same handful of lookups in many
+        tests, and ``InstructionScheduleMap.get`` materializes a fresh schedule on
+        each call, so cache the results on the class.
+        """
+        key = (name, tuple(qubits), params)
+        if key not in cls._get_cache:
+            cls._get_cache[key] = cls._inst_map.get(name, list(qubits), *params)
+        return cls._get_cache[key]
+
+    @classmethod
+    def _schedule_cx(cls, method=None):
+        """Schedule a bare CX on qubits 0 and 1, memoized per class and method.
+
+        Several tests re-run the scheduling pipeline on this same circuit; the
+        result is never mutated, so one schedule per method can be shared.
+        """
+        if method not in cls._cx_sched_cache:
+            cls._cx_sched_cache[method] = schedule(cls._cx_circ, cls._backend, method=method)
+        return cls._cx_sched_cache[method]
+
+    def assertScheduleEqual(self, actual_sched, expected_sched):
+        """Assert that two schedules contain the same timed instructions.
+
+        The comparison is insensitive to the ordering of instructions that are
+        tied at the same start time, so the schedule builder is free to break
+        such ties in whatever order is cheapest to produce.
+        """
+        self.assertCountEqual(list(actual_sched.instructions), list(expected_sched.instructions))
 
-class TestBasicSchedule(QiskitTestCase):
+
+class TestBasicSchedule(BaseTestSchedule):
     """Scheduling tests."""
 
+    @classmethod
+    def setUpClass(cls):
+        # Building the fake backend requires parsing its JSON snapshots, which is by far
+        # the most expensive part of these tests, so do it once for the whole class.
+        super().setUpClass()
+        cls._backend = _fake_open_pulse_2q()
+        cls._inst_map = cls._backend.defaults().instruction_schedule_map
+        # Expected measurement schedules are pure functions of (qubits, backend,
+        # mem_slots), so build them once rather than per test.
+        cls._meas_q0_mem1 = macros.measure([0], cls._backend, qubit_mem_slots={0: 1})
+        cls._meas_q1_3q = macros.measure([1], _fake_open_pulse_3q()).exclude(
+            channels=[AcquireChannel(0), AcquireChannel(2)]
+        )
+
     def setUp(self):
         super().setUp()
-        self.backend = FakeOpenPulse2Q()
-        self.inst_map = self.backend.defaults().instruction_schedule_map
+        self.backend = self._backend
+        self.inst_map = self._inst_map
 
     def test_unavailable_defaults(self):
         """Test backend with unavailable defaults."""
@@ -52,8 +146,8 @@ class TestBasicSchedule(QiskitTestCase):
         backend.defaults = backend.configuration
         self.assertRaises(QiskitError, lambda: schedule(qc, backend))
 
-    def test_alap_pass(self):
-        """Test ALAP scheduling."""
+    def test_alap_asap_scheduling(self):
+        """Test ALAP and ASAP scheduling of the same circuit."""
 
         #       ┌───────────────┐                    ░      ┌─┐
         # q0_0: ┤ U2(3.14,1.57) ├────────────────────░───■──┤M├───
@@ -62,8 +156,8 @@ class TestBasicSchedule(QiskitTestCase):
         #        └──────────────┘ ░ └──────────────┘ ░ └───┘ ║ └╥┘
         # c0: 2/═════════════════════════════════════════════╩══╩═
         #                                                    0  1
-        q = QuantumRegister(2)
-        c = ClassicalRegister(2)
+        q = self._q2
+        c = self._c2
         qc = QuantumCircuit(q, c)
         qc.append(U2Gate(3.14, 1.57), [q[0]])
         qc.append(U2Gate(0.5, 0.25), [q[1]])
@@ -72,121 +166,77 @@ class TestBasicSchedule(QiskitTestCase):
         qc.barrier(q[0], [q[1]])
         qc.cx(q[0], q[1])
         qc.measure(q, c)
-        sched = schedule(qc, self.backend)
-        # X pulse on q0 should end at the start of the CNOT
-        expected = Schedule(
-            (2, self.inst_map.get("u2", [0], 3.14, 1.57)),
-            self.inst_map.get("u2", [1], 0.5, 0.25),
-            (2, self.inst_map.get("u2", [1], 0.5, 0.25)),
-            (4, self.inst_map.get("cx", [0, 1])),
-            (26, self.inst_map.get("measure", [0, 1])),
-        )
-        for actual, expected in zip(sched.instructions, expected.instructions):
-            self.assertEqual(actual[0], expected[0])
-            self.assertEqual(actual[1], expected[1])
+        # Only the U2 on q0 moves between the two methods: under ALAP its pulse
+        # should end at the start of the CNOT, under ASAP it should start at t=0.
+        for method, u2_q0_time in [("as_late_as_possible", 2), ("as_soon_as_possible", 0)]:
+            with self.subTest(method=method):
+                sched = schedule(qc, self.backend, method=method)
+                expected = Schedule(
+                    (u2_q0_time, self._get("u2", [0], 3.14, 1.57)),
+                    self._get("u2", [1], 0.5, 0.25),
+                    (2, self._get("u2", [1], 0.5, 0.25)),
+                    (4, self._get("cx", [0, 1])),
+                    (26, self._get("measure", [0, 1])),
+                )
+                self.assertScheduleEqual(sched, expected)
 
     def test_single_circuit_list_schedule(self):
         """Test that passing a single circuit list to schedule() returns a list."""
-        q = QuantumRegister(2)
-        c = ClassicalRegister(2)
+        q = self._q2
+        c = self._c2
         qc = QuantumCircuit(q, c)
         sched = schedule([qc], self.backend, method="alap")
-        expected = Schedule()
         self.assertIsInstance(sched, list)
-        self.assertEqual(sched[0].instructions, expected.instructions)
+        self.assertEqual(sched[0].instructions, ())
 
     def test_alap_with_barriers(self):
         """Test that ALAP respects barriers on new qubits."""
-        q = QuantumRegister(2)
-        c = ClassicalRegister(2)
+        q = self._q2
+        c = self._c2
         qc = QuantumCircuit(q, c)
         qc.append(U2Gate(0, 0), [q[0]])
         qc.barrier(q[0], q[1])
         qc.append(U2Gate(0, 0), [q[1]])
         sched = schedule(qc, self.backend, method="alap")
-        expected = Schedule(
-            self.inst_map.get("u2", [0], 0, 0), (2, self.inst_map.get("u2", [1], 0, 0))
-        )
-        for actual, expected in zip(sched.instructions, expected.instructions):
-            self.assertEqual(actual[0], expected[0])
-            self.assertEqual(actual[1], expected[1])
+        expected = Schedule(self._get("u2", [0], 0, 0), (2, self._get("u2", [1], 0, 0)))
+        self.assertScheduleEqual(sched, expected)
 
     def test_empty_circuit_schedule(self):
         """Test empty circuit being scheduled."""
-        q = QuantumRegister(2)
-        c = ClassicalRegister(2)
+        q = self._q2
+        c = self._c2
         qc = QuantumCircuit(q, c)
         sched = schedule(qc, self.backend, method="alap")
-        expected = Schedule()
-        self.assertEqual(sched.instructions, expected.instructions)
+        self.assertEqual(sched.instructions, ())
 
     def test_alap_aligns_end(self):
         """Test that ALAP always acts as though there is a final global barrier."""
-        q = QuantumRegister(2)
-        c = ClassicalRegister(2)
+        q = self._q2
+        c = self._c2
         qc = QuantumCircuit(q, c)
         qc.append(U3Gate(0, 0, 0), [q[0]])
         qc.append(U2Gate(0, 0), [q[1]])
         sched = schedule(qc, self.backend, method="alap")
-        expected_sched = Schedule(
-            (2, self.inst_map.get("u2", [1], 0, 0)), self.inst_map.get("u3", [0], 0, 0, 0)
-        )
-        for actual, expected in zip(sched.instructions, expected_sched.instructions):
-            self.assertEqual(actual[0], expected[0])
-            self.assertEqual(actual[1], expected[1])
+        expected_sched = Schedule((2, self._get("u2", [1], 0, 0)), self._get("u3", [0], 0, 0, 0))
+        self.assertScheduleEqual(sched, expected_sched)
         self.assertEqual(
             sched.ch_duration(DriveChannel(0)), expected_sched.ch_duration(DriveChannel(1))
         )
 
-    def test_asap_pass(self):
-        """Test ASAP scheduling."""
-
-        #       ┌───────────────┐                    ░      ┌─┐
-        # q0_0: ┤ U2(3.14,1.57) ├────────────────────░───■──┤M├───
-        #       └┬──────────────┤ ░ ┌──────────────┐ ░ ┌─┴─┐└╥┘┌─┐
-        # q0_1: ─┤ U2(0.5,0.25) ├─░─┤ U2(0.5,0.25) ├─░─┤ X ├─╫─┤M├
-        #        └──────────────┘ ░ └──────────────┘ ░ └───┘ ║ └╥┘
-        # c0: 2/═════════════════════════════════════════════╩══╩═
-        #                                                    0  1
-        q = QuantumRegister(2)
-        c = ClassicalRegister(2)
-        qc = QuantumCircuit(q, c)
-        qc.append(U2Gate(3.14, 1.57), [q[0]])
-        qc.append(U2Gate(0.5, 0.25), [q[1]])
-        qc.barrier(q[1])
-        qc.append(U2Gate(0.5, 0.25), [q[1]])
-        qc.barrier(q[0], q[1])
-        qc.cx(q[0], q[1])
-        qc.measure(q, c)
-        sched = schedule(qc, self.backend, method="as_soon_as_possible")
-        # X pulse on q0 should start at t=0
-        expected = Schedule(
-            self.inst_map.get("u2", [0], 3.14, 1.57),
-            self.inst_map.get("u2", [1], 0.5, 0.25),
-            (2, self.inst_map.get("u2", [1], 0.5, 0.25)),
-            (4, self.inst_map.get("cx", [0, 1])),
-            (26, self.inst_map.get("measure", [0, 1])),
-        )
-        for actual, expected in zip(sched.instructions, expected.instructions):
-            self.assertEqual(actual[0], expected[0])
-            self.assertEqual(actual[1], expected[1])
-
     def test_alap_resource_respecting(self):
         """Test that the ALAP pass properly respects busy resources when backwards scheduling.
         For instance, a CX on 0 and 1 followed by an X on only 1 must respect both qubits'
         timeline."""
-        q = QuantumRegister(2)
-        c = ClassicalRegister(2)
-        qc = QuantumCircuit(q, c)
-        qc.cx(q[0], q[1])
+        q = self._q2
+        c = self._c2
+        qc = self._cx_circ.copy()
         qc.append(U2Gate(0.5, 0.25), [q[1]])
         sched = schedule(qc, self.backend, method="as_late_as_possible")
         insts = sched.instructions
         self.assertEqual(insts[0][0], 0)
         self.assertEqual(insts[6][0], 22)
 
-        qc = QuantumCircuit(q, c)
-        qc.cx(q[0], q[1])
+        qc = self._cx_circ.copy()
         qc.append(U2Gate(0.5, 0.25), [q[1]])
         qc.measure(q, c)
         sched = schedule(qc, self.backend, method="as_late_as_possible")
@@ -194,15 +244,9 @@ class TestBasicSchedule(QiskitTestCase):
 
     def test_inst_map_schedules_unaltered(self):
         """Test that forward scheduling doesn't change relative timing with a command."""
-        q = QuantumRegister(2)
-        c = ClassicalRegister(2)
-        qc = QuantumCircuit(q, c)
-        qc.cx(q[0], q[1])
-        sched1 = schedule(qc, self.backend, method="as_soon_as_possible")
-        sched2 = schedule(qc, self.backend, method="as_late_as_possible")
-        for asap, alap in zip(sched1.instructions, sched2.instructions):
-            self.assertEqual(asap[0], alap[0])
-            self.assertEqual(asap[1], alap[1])
+        sched1 = self._schedule_cx(method="as_soon_as_possible")
+        sched2 = self._schedule_cx(method="as_late_as_possible")
+        self.assertScheduleEqual(sched1, sched2)
         insts = sched1.instructions
         self.assertEqual(insts[0][0], 0)  # shift phase
         self.assertEqual(insts[1][0], 0)  # ym_d0
@@ -218,8 +262,8 @@ class TestBasicSchedule(QiskitTestCase):
         The measures on different qubits are combined, but measures on the same qubit
         adds another measure to the schedule.
         """
-        q = QuantumRegister(2)
-        c = ClassicalRegister(2)
+        q = self._q2
+        c = self._c2
         qc = QuantumCircuit(q, c)
         qc.append(U2Gate(3.14, 1.57), [q[0]])
         qc.cx(q[0], q[1])
@@ -228,10 +272,10 @@ class TestBasicSchedule(QiskitTestCase):
         qc.measure(q[1], c[1])
         sched = schedule(qc, self.backend, method="as_soon_as_possible")
         expected = Schedule(
-            self.inst_map.get("u2", [0], 3.14, 1.57),
-            (2, self.inst_map.get("cx", [0, 1])),
-            (24, self.inst_map.get("measure", [0, 1])),
-            (34, self.inst_map.get("measure", [0, 1]).filter(channels=[MeasureChannel(1)])),
+            self._get("u2", [0], 3.14, 1.57),
+            (2, self._get("cx", [0, 1])),
+            (24, self._get("measure", [0, 1])),
+            (34, self._get("measure", [0, 1]).filter(channels=[MeasureChannel(1)])),
             (34, Acquire(10, AcquireChannel(1), MemorySlot(1))),
         )
         self.assertEqual(sched.instructions, expected.instructions)
@@ -246,10 +290,10 @@ class TestBasicSchedule(QiskitTestCase):
         #       ┌──────┴───┴──────┐ └───────────────┘ ┌─┴─┐┌─────────────────┐
         # q0_2: ┤ U2(0.778,0.122) ├───────────────────┤ X ├┤ U2(0.778,0.122) ├
         #       └─────────────────┘                   └───┘└─────────────────┘
-        backend = FakeOpenPulse3Q()
+        backend = _fake_open_pulse_3q()
         inst_map = backend.defaults().instruction_schedule_map
-        q = QuantumRegister(3)
-        c = ClassicalRegister(3)
+        q = self._q3
+        c = self._c3
         qc = QuantumCircuit(q, c)
         qc.cx(q[0], q[1])
         qc.append(U2Gate(0.778, 0.122), [q[2]])
@@ -266,30 +310,19 @@ class TestBasicSchedule(QiskitTestCase):
             (44, inst_map.get("u3", [0], 3.14, 1.57, 0)),
             (46, inst_map.get("u2", [2], 0.778, 0.122)),
         )
-        for actual, expected in zip(sched.instructions, expected.instructions):
-            self.assertEqual(actual[0], expected[0])
-            self.assertEqual(actual[1], expected[1])
+        self.assertScheduleEqual(sched, expected)
 
     def test_schedule_multi(self):
         """Test scheduling multiple circuits at once."""
-        q = QuantumRegister(2)
-        c = ClassicalRegister(2)
-        qc0 = QuantumCircuit(q, c)
-        qc0.cx(q[0], q[1])
-        qc1 = QuantumCircuit(q, c)
-        qc1.cx(q[0], q[1])
+        qc0 = self._cx_circ.copy()
+        qc1 = self._cx_circ.copy()
         schedules = schedule([qc0, qc1], self.backend)
-        expected_insts = schedule(qc0, self.backend).instructions
-        for actual, expected in zip(schedules[0].instructions, expected_insts):
-            self.assertEqual(actual[0], expected[0])
-            self.assertEqual(actual[1], expected[1])
+        expected_insts = self._schedule_cx().instructions
+        self.assertEqual(list(schedules[0].instructions), list(expected_insts))
 
     def test_circuit_name_kept(self):
         """Test that the new schedule gets its name from the circuit."""
-        q = QuantumRegister(2)
-        c = ClassicalRegister(2)
-        qc = QuantumCircuit(q, c, name="CIRCNAME")
-        qc.cx(q[0], q[1])
+        qc = self._cx_circ.copy(name="CIRCNAME")
         sched = schedule(qc, self.backend, method="asap")
         self.assertEqual(sched.name, qc.name)
         sched = schedule(qc, self.backend, method="alap")
@@ -305,50 +338,44 @@ class TestBasicSchedule(QiskitTestCase):
 
         In ALAP scheduling, the next operation on qubit 0 would be added at t=0 rather
         than immediately before the X gate.
-        """
-        qr = QuantumRegister(2)
-        qc = QuantumCircuit(qr)
-        for i in range(2):
-            qc.append(U2Gate(0, 0), [qr[i]])
-            qc.append(U1Gate(3.14), [qr[i]])
-            qc.append(U2Gate(0, 0), [qr[i]])
-        sched = schedule(qc, self.backend, method="alap")
-        expected = Schedule(
-            self.inst_map.get("u2", [0], 0, 0),
-            self.inst_map.get("u2", [1], 0, 0),
-            (2, self.inst_map.get("u1", [0], 3.14)),
-            (2, self.inst_map.get("u1", [1], 3.14)),
-            (2, self.inst_map.get("u2", [0], 0, 0)),
-            (2, self.inst_map.get("u2", [1], 0, 0)),
-        )
-        for actual, expected in zip(sched.instructions, expected.instructions):
-            self.assertEqual(actual[0], expected[0])
-            self.assertEqual(actual[1], expected[1])
 
-    def test_barriers_in_middle(self):
-        """As a follow on to `test_can_add_gates_into_free_space`, similar issues
-        arose for barriers, specifically.
+        As a follow on, similar issues arose for barriers, specifically, so the same
+        circuit with barriers in the middle is batch-scheduled in the same
+        ``schedule()`` call; the expected schedule is unchanged by the barriers.
         """
-        qr = QuantumRegister(2)
+        qr = self._q2
+        u2_00 = U2Gate(0, 0)
+        u1_314 = U1Gate(3.14)
         qc = QuantumCircuit(qr)
-        for i in range(2):
-            qc.append(U2Gate(0, 0), [qr[i]])
-            qc.barrier(qr[i])
-            qc.append(U1Gate(3.14), [qr[i]])
-            qc.barrier(qr[i])
-            qc.append(U2Gate(0, 0), [qr[i]])
-        sched = schedule(qc, self.backend, method="alap")
+        qc.append(u2_00, [qr[0]])
+        qc.append(u1_314, [qr[0]])
+        qc.append(u2_00, [qr[0]])
+        qc.append(u2_00, [qr[1]])
+        qc.append(u1_314, [qr[1]])
+        qc.append(u2_00, [qr[1]])
+        qc_barriers = QuantumCircuit(qr)
+        qc_barriers.append(u2_00, [qr[0]])
+        qc_barriers.barrier(qr[0])
+        qc_barriers.append(u1_314, [qr[0]])
+        qc_barriers.barrier(qr[0])
+        qc_barriers.append(u2_00, [qr[0]])
+        qc_barriers.append(u2_00, [qr[1]])
+        qc_barriers.barrier(qr[1])
+        qc_barriers.append(u1_314, [qr[1]])
+        qc_barriers.barrier(qr[1])
+        qc_barriers.append(u2_00, [qr[1]])
+        scheds = schedule([qc, qc_barriers], self.backend, method="alap")
         expected = Schedule(
-            self.inst_map.get("u2", [0], 0, 0),
-            self.inst_map.get("u2", [1], 0, 0),
-            (2, self.inst_map.get("u1", [0], 3.14)),
-            (2, self.inst_map.get("u1", [1], 3.14)),
-            (2, self.inst_map.get("u2", [0], 0, 0)),
-            (2, self.inst_map.get("u2", [1], 0, 0)),
+            self._get("u2", [0], 0, 0),
+            self._get("u2", [1], 0, 0),
+            (2, self._get("u1", [0], 3.14)),
+            (2, self._get("u1", [1], 3.14)),
+            (2, self._get("u2", [0], 0, 0)),
+            (2, self._get("u2", [1], 0, 0)),
         )
-        for actual, expected in zip(sched.instructions, expected.instructions):
-            self.assertEqual(actual[0], expected[0])
-            self.assertEqual(actual[1], expected[1])
+        for circuit, sched in zip([qc, qc_barriers], scheds):
+            with self.subTest(circuit=circuit.name):
+                self.assertScheduleEqual(sched, expected)
 
     def test_parametric_input(self):
         """Test that scheduling works with parametric pulses as input."""
@@ -358,41 +385,43 @@ class TestBasicSchedule(QiskitTestCase):
         custom_gauss = Schedule(
             Play(Gaussian(duration=25, sigma=4, amp=0.5, angle=pi / 2), DriveChannel(0))
         )
-        self.inst_map.add("gauss", [0], custom_gauss)
-        sched = schedule(qc, self.backend, inst_map=self.inst_map)
+        # Copy the shared instruction map so the class-level fixture is not polluted.
+        inst_map = copy.deepcopy(self.inst_map)
+        inst_map.add("gauss", [0], custom_gauss)
+        sched = schedule(qc, self.backend, inst_map=inst_map)
         self.assertEqual(sched.instructions[0], custom_gauss.instructions[0])
 
     def test_pulse_gates(self):
         """Test scheduling calibrated pulse gates."""
-        q = QuantumRegister(2)
+        q = self._q2
         qc = QuantumCircuit(q)
         qc.append(U2Gate(0, 0), [q[0]])
         qc.barrier(q[0], q[1])
         qc.append(U2Gate(0, 0), [q[1]])
-        qc.add_calibration("u2", [0], Schedule(Play(Gaussian(28, 0.2, 4), DriveChannel(0))), [0, 0])
-        qc.add_calibration("u2", [1], Schedule(Play(Gaussian(28, 0.2, 4), DriveChannel(1))), [0, 0])
+        qc.add_calibration("u2", [0], Schedule(Play(_GAUSS_28, DriveChannel(0))), [0, 0])
+        qc.add_calibration("u2", [1], Schedule(Play(_GAUSS_28, DriveChannel(1))), [0, 0])
 
         sched = schedule(qc, self.backend)
         expected = Schedule(
-            Play(Gaussian(28, 0.2, 4), DriveChannel(0)),
-            (28, Schedule(Play(Gaussian(28, 0.2, 4), DriveChannel(1)))),
+            Play(_GAUSS_28, DriveChannel(0)),
+            (28, Schedule(Play(_GAUSS_28, DriveChannel(1)))),
         )
         self.assertEqual(sched.instructions, expected.instructions)
 
     def test_calibrated_measurements(self):
         """Test scheduling calibrated measurements."""
-        q = QuantumRegister(2)
-        c = ClassicalRegister(2)
+        q = self._q2
+        c = self._c2
         qc = QuantumCircuit(q, c)
         qc.append(U2Gate(0, 0), [q[0]])
         qc.measure(q[0], c[0])
 
-        meas_sched = Play(Gaussian(1200, 0.2, 4), MeasureChannel(0))
+        meas_sched = Play(_GAUSS_1200, MeasureChannel(0))
         meas_sched |= Acquire(1200, AcquireChannel(0), MemorySlot(0))
         qc.add_calibration("measure", [0], meas_sched)
 
         sched = schedule(qc, self.backend)
-        expected = Schedule(self.inst_map.get("u2", [0], 0, 0), (2, meas_sched))
+        expected = Schedule(self._get("u2", [0], 0, 0), (2, meas_sched))
         self.assertEqual(sched.instructions, expected.instructions)
 
     def test_subset_calibrated_measurements(self):
@@ -404,37 +433,35 @@ class TestBasicSchedule(QiskitTestCase):
         qc.measure(2, 2)
         meas_scheds = []
         for qubit in [0, 2]:
-            meas = Play(Gaussian(1200, 0.2, 4), MeasureChannel(qubit)) + Acquire(
+            meas = Play(_GAUSS_1200, MeasureChannel(qubit)) + Acquire(
                 1200, AcquireChannel(qubit), MemorySlot(qubit)
             )
             meas_scheds.append(meas)
             qc.add_calibration("measure", [qubit], meas)
 
-        meas = macros.measure([1], FakeOpenPulse3Q())
-        meas = meas.exclude(channels=[AcquireChannel(0), AcquireChannel(2)])
-        sched = schedule(qc, FakeOpenPulse3Q())
-        expected = Schedule(meas_scheds[0], meas_scheds[1], meas)
+        sched = schedule(qc, _fake_open_pulse_3q())
+        expected = Schedule(meas_scheds[0], meas_scheds[1], self._meas_q1_3q)
         self.assertEqual(sched.instructions, expected.instructions)
 
     def test_clbits_of_calibrated_measurements(self):
         """Test that calibrated measurements are only used when the classical bits also match."""
-        q = QuantumRegister(2)
-        c = ClassicalRegister(2)
+        q = self._q2
+        c = self._c2
         qc = QuantumCircuit(q, c)
         qc.measure(q[0], c[1])
 
-        meas_sched = Play(Gaussian(1200, 0.2, 4), MeasureChannel(0))
+        meas_sched = Play(_GAUSS_1200, MeasureChannel(0))
         meas_sched |= Acquire(1200, AcquireChannel(0), MemorySlot(0))
         qc.add_calibration("measure", [0], meas_sched)
 
         sched = schedule(qc, self.backend)
         # Doesn't use the calibrated schedule because the classical memory slots do not match
-        expected = Schedule(macros.measure([0], self.backend, qubit_mem_slots={0: 1}))
+        expected = Schedule(self._meas_q0_mem1)
         self.assertEqual(sched.instructions, expected.instructions)
 
     def test_metadata_is_preserved_alap(self):
         """Test that circuit metadata is preserved in output schedule with alap."""
-        q = QuantumRegister(2)
+        q = self._q2
         qc = QuantumCircuit(q)
         qc.append(U2Gate(0, 0), [q[0]])
         qc.barrier(q[0], q[1])
@@ -445,7 +472,7 @@ class TestBasicSchedule(QiskitTestCase):
 
     def test_metadata_is_preserved_asap(self):
         """Test that circuit metadata is preserved in output schedule with asap."""
-        q = QuantumRegister(2)
+        q = self._q2
         qc = QuantumCircuit(q)
         qc.append(U2Gate(0, 0), [q[0]])
         qc.barrier(q[0], q[1])
@@ -474,7 +501,7 @@ class TestBasicSchedule(QiskitTestCase):
             play(Gaussian(duration=160, amp=x, sigma=40), DriveChannel(0))
         qc.add_calibration(gate="pulse_gate", qubits=[0], schedule=expected_schedule, params=[x])
         sched = schedule(qc, self.backend)
-        self.assertEqual(sched, transforms.target_qobj_transform(expected_schedule))
+        self.assertEqual(sched, target_qobj_transform(expected_schedule))
 
     def test_schedule_block_in_instmap(self):
         """Test schedule block in instmap can be scheduled."""
@@ -498,16 +525,30 @@ class TestBasicSchedule(QiskitTestCase):
         self.assertEqual(sched, ref_sched)
 
 
-class TestBasicScheduleV2(QiskitTestCase):
+class TestBasicScheduleV2(BaseTestSchedule):
     """Scheduling tests."""
 
+    @classmethod
+    def setUpClass(cls):
+        # Building the fake backend requires parsing its JSON snapshots, which is by far
+        # the most expensive part of these tests, so do it once for the whole class.
+        super().setUpClass()
+        cls._backend = _fake_perth()
+        cls._inst_map = cls._backend.instruction_schedule_map
+        # Expected measurement schedules are pure functions of (qubits, backend,
+        # mem_slots), so build them once rather than per test.
+        cls._meas_q0_mem1 = macros.measure([0], cls._backend, qubit_mem_slots={0: 1})
+        cls._meas_q1_mem1 = macros.measure(
+            qubits=[1], backend=cls._backend, qubit_mem_slots={0: 0, 1: 1}
+        ).exclude(channels=[AcquireChannel(0), AcquireChannel(2)])
+
     def setUp(self):
         super().setUp()
-        self.backend = FakePerth()
-        self.inst_map = self.backend.instruction_schedule_map
+        self.backend = self._backend
+        self.inst_map = self._inst_map
 
-    def test_alap_pass(self):
-        """Test ALAP scheduling."""
+    def test_alap_asap_scheduling(self):
+        """Test ALAP and ASAP scheduling of the same circuit."""
 
         #       ┌────┐          ░      ┌─┐
         # q0_0: ┤ √X ├──────────░───■──┤M├───
@@ -517,8 +558,8 @@ class TestBasicScheduleV2(QiskitTestCase):
         # c0: 2/════════════════════════╩══╩═
         #                               0  1
 
-        q = QuantumRegister(2)
-        c = ClassicalRegister(2)
+        q = self._q2
+        c = self._c2
         qc = QuantumCircuit(q, c)
 
         qc.sx(q[0])
@@ -531,69 +572,69 @@ class TestBasicScheduleV2(QiskitTestCase):
         qc.cx(q[0], q[1])
         qc.measure(q, c)
 
-        sched = schedule(circuits=qc, backend=self.backend, method="alap")
-        # Since, the method of scheduling chosen here is 'as_late_as_possible'
-        # so all the π/2 pulse here should be right shifted.
-        #
         # Calculations:
         #   Duration of the π/2 pulse for FakePerth backend is 160dt
-        #   first π/2 pulse on q0 should start at 160dt because of 'as_late_as_possible'.
+        #   first π/2 pulse on q0 starts at 160dt under 'as_late_as_possible' (right
+        #   shifted) and at 0dt under 'as_soon_as_possible' (left shifted).
         #   first π/2 pulse on q1 should start 0dt.
         #   second π/2 pulse on q1 should start with a delay of 160dt.
         #   cx pulse( pulse on drive channel, control channel) should start with a delay
         #   of 160dt+160dt.
         #   measure pulse should start with a delay of 160dt+160dt+1760dt(1760dt for cx gate).
-        expected = Schedule(
-            (0, self.inst_map.get("sx", [1])),
-            (0 + 160, self.inst_map.get("sx", [0])),  # Right shifted because of alap.
-            (0 + 160, self.inst_map.get("sx", [1])),
-            (0 + 160 + 160, self.inst_map.get("cx", [0, 1])),
-            (0 + 160 + 160 + 1760, Acquire(1472, AcquireChannel(0), MemorySlot(0))),
-            (0 + 160 + 160 + 1760, Acquire(1472, AcquireChannel(1), MemorySlot(1))),
-            (
-                0 + 160 + 160 + 1760,
-                Play(
-                    GaussianSquare(
-                        duration=1472,
-                        sigma=64,
-                        width=1216,
-                        amp=0.24000000000000002,
-                        angle=-0.24730169436555283,
-                        name="M_m0",
+        for method, sx_q0_time in [("alap", 160), ("asap", 0)]:
+            with self.subTest(method=method):
+                sched = schedule(circuits=qc, backend=self.backend, method=method)
+                expected = Schedule(
+                    (0, self._get("sx", [1])),
+                    (sx_q0_time, self._get("sx", [0])),
+                    (0 + 160, self._get("sx", [1])),
+                    (0 + 160 + 160, self._get("cx", [0, 1])),
+                    (0 + 160 + 160 + 1760, Acquire(1472, AcquireChannel(0), MemorySlot(0))),
+                    (0 + 160 + 160 + 1760, Acquire(1472, AcquireChannel(1), MemorySlot(1))),
+                    (
+                        0 + 160 + 160 + 1760,
+                        Play(
+                            GaussianSquare(
+                                duration=1472,
+                                sigma=64,
+                                width=1216,
+                                amp=0.24000000000000002,
+                                angle=-0.24730169436555283,
+                                name="M_m0",
+                            ),
+                            MeasureChannel(0),
+                            name="M_m0",
+                        ),
                     ),
-                    MeasureChannel(0),
-                    name="M_m0",
-                ),
-            ),
-            (
-                0 + 160 + 160 + 1760,
-                Play(
-                    GaussianSquare(
-                        duration=1472,
-                        sigma=64,
-                        width=1216,
-                        amp=0.32,
-                        angle=-1.9900962136758156,
-                        name="M_m1",
+                    (
+                        0 + 160 + 160 + 1760,
+                        Play(
+                            GaussianSquare(
+                                duration=1472,
+                                sigma=64,
+                                width=1216,
+                                amp=0.32,
+                                angle=-1.9900962136758156,
+                                name="M_m1",
+                            ),
+                            MeasureChannel(1),
+                            name="M_m1",
+                        ),
                     ),
-                    MeasureChannel(1),
-                    name="M_m1",
-                ),
-            ),
-        )
-        for actual, expected in zip(sched.instructions, expected.instructions):
-            self.assertEqual(actual[0], expected[0])
-            self.assertEqual(actual[1], expected[1])
+                    # Time for the measure channels to relax after the measurement pulses.
+                    (0 + 160 + 160 + 1760 + 1472, Delay(1568, MeasureChannel(0))),
+                    (0 + 160 + 160 + 1760 + 1472, Delay(1568, MeasureChannel(1))),
+                )
+                self.assertScheduleEqual(sched, expected)
 
     def test_single_circuit_list_schedule(self):
         """Test that passing a single circuit list to schedule() returns a list."""
-        q = QuantumRegister(2)
-        c = ClassicalRegister(2)
+        q = self._q2
+        c = self._c2
         qc = QuantumCircuit(q, c)
         sched = schedule([qc], self.backend, method="alap")
-        expected = Schedule()
         self.assertIsInstance(sched, list)
-        self.assertEqual(sched[0].instructions, expected.instructions)
+        self.assertEqual(sched[0].instructions, ())
 
     def test_alap_with_barriers(self):
         """Test that ALAP respects barriers on new qubits."""
@@ -606,8 +647,8 @@ class TestBasicScheduleV2(QiskitTestCase):
         # c0: 2/═══════════════
         #
 
-        q = QuantumRegister(2)
-        c = ClassicalRegister(2)
+        q = self._q2
+        c = self._c2
         qc = QuantumCircuit(q, c)
         qc.append(SXGate(), [q[0]])
         qc.barrier(q[0], q[1])
@@ -615,18 +656,16 @@ class TestBasicScheduleV2(QiskitTestCase):
         sched = schedule(qc, self.backend, method="alap")
         # If there wasn't a barrier the π/2 pulse on q1 would have started from 0dt, but since,
         # there is a barrier so the π/2 pulse on q1 should start with a delay of 160dt.
-        expected = Schedule((0, self.inst_map.get("sx", [0])), (160, self.inst_map.get("sx", [1])))
-        for actual, expected in zip(sched.instructions, expected.instructions):
-            self.assertEqual(actual, expected)
+        expected = Schedule((0, self._get("sx", [0])), (160, self._get("sx", [1])))
+        self.assertScheduleEqual(sched, expected)
 
     def test_empty_circuit_schedule(self):
         """Test empty circuit being scheduled."""
-        q = QuantumRegister(2)
-        c = ClassicalRegister(2)
+        q = self._q2
+        c = self._c2
         qc = QuantumCircuit(q, c)
         sched = schedule(qc, self.backend, method="alap")
-        expected = Schedule()
-        self.assertEqual(sched.instructions, expected.instructions)
+        self.assertEqual(sched.instructions, ())
 
     def test_alap_aligns_end(self):
         """Test that ALAP always acts as though there is a final global barrier."""
@@ -637,109 +676,25 @@ class TestBasicScheduleV2(QiskitTestCase):
         #       └────┘
         # c1: 2/══════
 
-        q = QuantumRegister(2)
-        c = ClassicalRegister(2)
+        q = self._q2
+        c = self._c2
         qc = QuantumCircuit(q, c)
         qc.sx(q[0])
         qc.sx(q[1])
         sched = schedule(qc, self.backend, method="alap")
-        expected_sched = Schedule(
-            (0, self.inst_map.get("sx", [1])), (0, self.inst_map.get("sx", [0]))
-        )
-        for actual, expected in zip(sched.instructions, expected_sched.instructions):
-            self.assertEqual(actual[0], expected[0])
-            self.assertEqual(actual[1], expected[1])
+        expected_sched = Schedule((0, self._get("sx", [1])), (0, self._get("sx", [0])))
+        self.assertScheduleEqual(sched, expected_sched)
         self.assertEqual(
             sched.ch_duration(DriveChannel(0)), expected_sched.ch_duration(DriveChannel(1))
         )
 
-    def test_asap_pass(self):
-        """Test ASAP scheduling."""
-
-        #       ┌────┐          ░      ┌─┐
-        # q0_0: ┤ √X ├──────────░───■──┤M├───
-        #       ├────┤ ░ ┌────┐ ░ ┌─┴─┐└╥┘┌─┐
-        # q0_1: ┤ √X ├─░─┤ √X ├─░─┤ X ├─╫─┤M├
-        #       └────┘ ░ └────┘ ░ └───┘ ║ └╥┘
-        # c0: 2/════════════════════════╩══╩═
-        #                               0  1
-
-        q = QuantumRegister(2)
-        c = ClassicalRegister(2)
-        qc = QuantumCircuit(q, c)
-
-        qc.sx(q[0])
-        qc.sx(q[1])
-        qc.barrier(q[1])
-
-        qc.sx(q[1])
-        qc.barrier(q[0], q[1])
-
-        qc.cx(q[0], q[1])
-        qc.measure(q, c)
-
-        sched = schedule(circuits=qc, backend=self.backend, method="asap")
-        # Since, the method of scheduling chosen here is 'as_soon_as_possible'
-        # so all the π/2 pulse here should be left shifted.
-        #
-        # Calculations:
-        #   Duration of the π/2 pulse for FakePerth backend is 160dt
-        #   first π/2 pulse on q0 should start at 0dt because of 'as_soon_as_possible'.
-        #   first π/2 pulse on q1 should start 0dt.
-        #   second π/2 pulse on q1 should start with a delay of 160dt.
-        #   cx pulse( pulse on drive channel, control channel) should start with a delay
-        #   of 160dt+160dt.
-        #   measure pulse should start with a delay of 160dt+160dt+1760dt(1760dt for cx gate).
-        expected = Schedule(
-            (0, self.inst_map.get("sx", [1])),
-            (0, self.inst_map.get("sx", [0])),  # Left shifted because of asap.
-            (0 + 160, self.inst_map.get("sx", [1])),
-            (0 + 160 + 160, self.inst_map.get("cx", [0, 1])),
-            (0 + 160 + 160 + 1760, Acquire(1472, AcquireChannel(0), MemorySlot(0))),
-            (0 + 160 + 160 + 1760, Acquire(1472, AcquireChannel(1), MemorySlot(1))),
-            (
-                0 + 160 + 160 + 1760,
-                Play(
-                    GaussianSquare(
-                        duration=1472,
-                        sigma=64,
-                        width=1216,
-                        amp=0.24000000000000002,
-                        angle=-0.24730169436555283,
-                        name="M_m0",
-                    ),
-                    MeasureChannel(0),
-                    name="M_m0",
-                ),
-            ),
-            (
-                0 + 160 + 160 + 1760,
-                Play(
-                    GaussianSquare(
-                        duration=1472,
-                        sigma=64,
-                        width=1216,
-                        amp=0.32,
-                        angle=-1.9900962136758156,
-                        name="M_m1",
-                    ),
-                    MeasureChannel(1),
-                    name="M_m1",
-                ),
-            ),
-        )
-        for actual, expected in zip(sched.instructions, expected.instructions):
-            self.assertEqual(actual[0], expected[0])
-            self.assertEqual(actual[1], expected[1])
-
     def test_alap_resource_respecting(self):
         """Test that the ALAP pass properly respects busy resources when backwards scheduling.
         For instance, a CX on 0 and 1 followed by an X on only 1 must respect both qubits'
         timeline."""
-        q = QuantumRegister(2)
-        c = ClassicalRegister(2)
-        qc = QuantumCircuit(q, c)
-        qc.cx(q[0], q[1])
+        q = self._q2
+        c = self._c2
+        qc = self._cx_circ.copy()
         qc.sx(q[1])
         sched = schedule(qc, self.backend, method="as_late_as_possible")
         insts = sched.instructions
@@ -752,8 +707,7 @@ class TestBasicScheduleV2(QiskitTestCase):
         # 1760dt is duration of cx operation on this backend.
         self.assertEqual(insts[9][0], 1760)
 
-        qc = QuantumCircuit(q, c)
-        qc.cx(q[0], q[1])
+        qc = self._cx_circ.copy()
         qc.sx(q[1])
         qc.measure(q, c)
         sched = schedule(qc, self.backend, method="as_late_as_possible")
@@ -765,15 +719,9 @@ class TestBasicScheduleV2(QiskitTestCase):
 
     def test_inst_map_schedules_unaltered(self):
         """Test that forward scheduling doesn't change relative timing with a command."""
-        q = QuantumRegister(2)
-        c = ClassicalRegister(2)
-        qc = QuantumCircuit(q, c)
-        qc.cx(q[0], q[1])
-        sched1 = schedule(qc, self.backend, method="as_soon_as_possible")
-        sched2 = schedule(qc, self.backend, method="as_late_as_possible")
-        for asap, alap in zip(sched1.instructions, sched2.instructions):
-            self.assertEqual(asap[0], alap[0])
-            self.assertEqual(asap[1], alap[1])
+        sched1 = self._schedule_cx(method="as_soon_as_possible")
+        sched2 = self._schedule_cx(method="as_late_as_possible")
+        self.assertScheduleEqual(sched1, sched2)
         insts = sched1.instructions
         self.assertEqual(insts[0][0], 0)  # ShiftPhase at DriveChannel(0) no dt required.
         self.assertEqual(insts[1][0], 0)  # ShiftPhase at ControlChannel(1) no dt required.
@@ -792,8 +740,8 @@ class TestBasicScheduleV2(QiskitTestCase):
         The measures on different qubits are combined, but measures on the same qubit
         adds another measure to the schedule.
         """
-        q = QuantumRegister(2)
-        c = ClassicalRegister(2)
+        q = self._q2
+        c = self._c2
         qc = QuantumCircuit(q, c)
         qc.sx(q[0])
         qc.cx(q[0], q[1])
@@ -804,9 +752,9 @@ class TestBasicScheduleV2(QiskitTestCase):
 
         expected_sched = Schedule(
             # This is the Schedule to implement sx gate.
-            (0, self.inst_map.get("sx", [0])),
+            (0, self._get("sx", [0])),
             # This is the schedule to implement cx gate
-            (0 + 160, self.inst_map.get("cx", [0, 1])),
+            (0 + 160, self._get("cx", [0, 1])),
             # Getting ready the to take classical data in MemorySlot(0) for qubit:0
             (0 + 160 + 1760, Acquire(1472, AcquireChannel(0), MemorySlot(0))),
             # Since, the method of Scheduling is 'as_soon_as_possilbe' so again for
@@ -881,8 +829,8 @@ class TestBasicScheduleV2(QiskitTestCase):
         #       └────┘      └───┘└────┘
         # c0: 3/═══════════════════════
 
-        q = QuantumRegister(3)
-        c = ClassicalRegister(3)
+        q = self._q3
+        c = self._c3
         qc = QuantumCircuit(q, c)
         qc.cx(q[0], q[1])
         qc.sx(q[0])
@@ -893,37 +841,26 @@ class TestBasicScheduleV2(QiskitTestCase):
 
         sched = schedule(qc, self.backend, method="asap")
         expected = Schedule(
-            (0, self.inst_map.get("cx", [0, 1])),
-            (0, self.inst_map.get("sx", [2])),
-            (0 + 1760, self.inst_map.get("sx", [0])),
-            (0 + 1760, self.inst_map.get("x", [1])),
-            (0 + 1760 + 160, self.inst_map.get("cx", [1, 2])),
-            (0 + 1760 + 1760, self.inst_map.get("sx", [2])),
+            (0, self._get("cx", [0, 1])),
+            (0, self._get("sx", [2])),
+            (0 + 1760, self._get("sx", [0])),
+            (0 + 1760, self._get("x", [1])),
+            (0 + 1760 + 160, self._get("cx", [1, 2])),
+            (0 + 1760 + 1760, self._get("sx", [2])),
         )
-        for actual, expected in zip(sched.instructions, expected.instructions):
-            self.assertEqual(actual[0], expected[0])
-            self.assertEqual(actual[1], expected[1])
+        self.assertScheduleEqual(sched, expected)
 
     def test_schedule_multi(self):
         """Test scheduling multiple circuits at once."""
-        q = QuantumRegister(2)
-        c = ClassicalRegister(2)
-        qc0 = QuantumCircuit(q, c)
-        qc0.cx(q[0], q[1])
-        qc1 = QuantumCircuit(q, c)
-        qc1.cx(q[0], q[1])
+        qc0 = self._cx_circ.copy()
+        qc1 = self._cx_circ.copy()
         schedules = schedule([qc0, qc1], self.backend)
-        expected_insts = schedule(qc0, self.backend).instructions
-        for actual, expected in zip(schedules[0].instructions, expected_insts):
-            self.assertEqual(actual[0], expected[0])
-            self.assertEqual(actual[1], expected[1])
+        expected_insts = self._schedule_cx().instructions
+        self.assertEqual(list(schedules[0].instructions), list(expected_insts))
 
     def test_circuit_name_kept(self):
         """Test that the new schedule gets its name from the circuit."""
-        q = QuantumRegister(2)
-        c = ClassicalRegister(2)
-        qc = QuantumCircuit(q, c, name="CIRCNAME")
-        qc.cx(q[0], q[1])
+        qc = self._cx_circ.copy(name="CIRCNAME")
         sched = schedule(qc, self.backend, method="asap")
         self.assertEqual(sched.name, qc.name)
         sched = schedule(qc, self.backend, method="alap")
@@ -939,50 +876,42 @@ class TestBasicScheduleV2(QiskitTestCase):
 
         In ALAP scheduling, the next operation on qubit 0 would be added at t=0 rather
         than immediately before the X gate.
-        """
-        qr = QuantumRegister(2)
-        qc = QuantumCircuit(qr)
-        for i in range(2):
-            qc.sx(qr[i])
-            qc.x(qr[i])
-            qc.sx(qr[i])
-        sched = schedule(qc, self.backend, method="alap")
-        expected = Schedule(
-            (0, self.inst_map.get("sx", [0])),
-            (0, self.inst_map.get("sx", [1])),
-            (0 + 160, self.inst_map.get("x", [0])),
-            (0 + 160, self.inst_map.get("x", [1])),
-            (0 + 160 + 160, self.inst_map.get("sx", [0])),
-            (0 + 160 + 160, self.inst_map.get("sx", [1])),
-        )
-        for actual, expected in zip(sched.instructions, expected.instructions):
-            self.assertEqual(actual[0], expected[0])
-            self.assertEqual(actual[1], expected[1])
 
-    def test_barriers_in_middle(self):
-        """As a follow on to `test_can_add_gates_into_free_space`, similar issues
-        arose for barriers, specifically.
+        As a follow on, similar issues arose for barriers, specifically, so the same
+        circuit with barriers in the middle is batch-scheduled in the same
+        ``schedule()`` call; the expected schedule is unchanged by the barriers.
         """
-        qr = QuantumRegister(2)
+        qr = self._q2
         qc = QuantumCircuit(qr)
-        for i in range(2):
-            qc.sx(qr[i])
-            qc.barrier(qr[i])
-            qc.x(qr[i])
-            qc.barrier(qr[i])
-            qc.sx(qr[i])
-        sched = schedule(qc, self.backend, method="alap")
+        qc.sx(qr[0])
+        qc.x(qr[0])
+        qc.sx(qr[0])
+        qc.sx(qr[1])
+        qc.x(qr[1])
+        qc.sx(qr[1])
+        qc_barriers = QuantumCircuit(qr)
+        qc_barriers.sx(qr[0])
+        qc_barriers.barrier(qr[0])
+        qc_barriers.x(qr[0])
+        qc_barriers.barrier(qr[0])
+        qc_barriers.sx(qr[0])
+        qc_barriers.sx(qr[1])
+        qc_barriers.barrier(qr[1])
+        qc_barriers.x(qr[1])
+        qc_barriers.barrier(qr[1])
+        qc_barriers.sx(qr[1])
+        scheds = schedule([qc, qc_barriers], self.backend, method="alap")
         expected = Schedule(
-            (0, self.inst_map.get("sx", [0])),
-            (0, self.inst_map.get("sx", [1])),
-            (0 + 160, self.inst_map.get("x", [0])),
-            (0 + 160, self.inst_map.get("x", [1])),
-            (0 + 160 + 160, self.inst_map.get("sx", [0])),
-            (0 + 160 + 160, self.inst_map.get("sx", [1])),
+            (0, self._get("sx", [0])),
+            (0, self._get("sx", [1])),
+            (0 + 160, self._get("x", [0])),
+            (0 + 160, self._get("x", [1])),
+            (0 + 160 + 160, self._get("sx", [0])),
+            (0 + 160 + 160, self._get("sx", [1])),
         )
-        for actual, expected in zip(sched.instructions, expected.instructions):
-            self.assertEqual(actual[0], expected[0])
-            self.assertEqual(actual[1], expected[1])
+        for circuit, sched in zip([qc, qc_barriers], scheds):
+            with self.subTest(circuit=circuit.name):
+                self.assertScheduleEqual(sched, expected)
 
     def test_parametric_input(self):
         """Test that scheduling works with parametric pulses as input."""
@@ -992,31 +921,33 @@ class TestBasicScheduleV2(QiskitTestCase):
         custom_gauss = Schedule(
             Play(Gaussian(duration=25, sigma=4, amp=0.5, angle=pi / 2), DriveChannel(0))
         )
-        self.inst_map.add("gauss", [0], custom_gauss)
-        sched = schedule(qc, self.backend, inst_map=self.inst_map)
+        # Copy the shared instruction map so the class-level fixture is not polluted.
+        inst_map = copy.deepcopy(self.inst_map)
+        inst_map.add("gauss", [0], custom_gauss)
+        sched = schedule(qc, self.backend, inst_map=inst_map)
         self.assertEqual(sched.instructions[0], custom_gauss.instructions[0])
 
     def test_pulse_gates(self):
         """Test scheduling calibrated pulse gates."""
-        q = QuantumRegister(2)
+        q = self._q2
         qc = QuantumCircuit(q)
         qc.append(U2Gate(0, 0), [q[0]])
         qc.barrier(q[0], q[1])
         qc.append(U2Gate(0, 0), [q[1]])
-        qc.add_calibration("u2", [0], Schedule(Play(Gaussian(28, 0.2, 4), DriveChannel(0))), [0, 0])
-        qc.add_calibration("u2", [1], Schedule(Play(Gaussian(28, 0.2, 4), DriveChannel(1))), [0, 0])
+        qc.add_calibration("u2", [0], Schedule(Play(_GAUSS_28, DriveChannel(0))), [0, 0])
+        qc.add_calibration("u2", [1], Schedule(Play(_GAUSS_28, DriveChannel(1))), [0, 0])
 
         sched = schedule(qc, self.backend)
         expected = Schedule(
-            Play(Gaussian(28, 0.2, 4), DriveChannel(0)),
-            (28, Schedule(Play(Gaussian(28, 0.2, 4), DriveChannel(1)))),
+            Play(_GAUSS_28, DriveChannel(0)),
+            (28, Schedule(Play(_GAUSS_28, DriveChannel(1)))),
         )
         self.assertEqual(sched.instructions, expected.instructions)
 
     def test_calibrated_measurements(self):
         """Test scheduling calibrated measurements."""
-        q = QuantumRegister(2)
-        c = ClassicalRegister(2)
+        q = self._q2
+        c = self._c2
         qc = QuantumCircuit(q, c)
         qc.sx(0)
         qc.measure(q[0], c[0])
@@ -1036,7 +967,7 @@ class TestBasicScheduleV2(QiskitTestCase):
         qc.add_calibration("measure", [0], meas_sched)
 
         sched = schedule(qc, self.backend)
-        expected = Schedule(self.inst_map.get("sx", [0]), (160, meas_sched))
+        expected = Schedule(self._get("sx", [0]), (160, meas_sched))
         self.assertEqual(sched.instructions, expected.instructions)
 
     def test_subset_calibrated_measurements(self):
@@ -1048,37 +979,35 @@ class TestBasicScheduleV2(QiskitTestCase):
         qc.measure(2, 2)
         meas_scheds = []
         for qubit in [0, 2]:
-            meas = Play(Gaussian(1200, 0.2, 4), MeasureChannel(qubit)) + Acquire(
+            meas = Play(_GAUSS_1200, MeasureChannel(qubit)) + Acquire(
                 1200, AcquireChannel(qubit), MemorySlot(qubit)
             )
             meas_scheds.append(meas)
             qc.add_calibration("measure", [qubit], meas)
 
-        meas = macros.measure(qubits=[1], backend=self.backend, qubit_mem_slots={0: 0, 1: 1})
-        meas = meas.exclude(channels=[AcquireChannel(0), AcquireChannel(2)])
         sched = schedule(qc, self.backend)
-        expected = Schedule(meas_scheds[0], meas_scheds[1], meas)
+        expected = Schedule(meas_scheds[0], meas_scheds[1], self._meas_q1_mem1)
         self.assertEqual(sched.instructions, expected.instructions)
 
     def test_clbits_of_calibrated_measurements(self):
         """Test that calibrated measurements are only used when the classical bits also match."""
-        q = QuantumRegister(2)
-        c = ClassicalRegister(2)
+        q = self._q2
+        c = self._c2
         qc = QuantumCircuit(q, c)
         qc.measure(q[0], c[1])
 
-        meas_sched = Play(Gaussian(1200, 0.2, 4), MeasureChannel(0))
+        meas_sched = Play(_GAUSS_1200, MeasureChannel(0))
         meas_sched |= Acquire(1200, AcquireChannel(0), MemorySlot(0))
         qc.add_calibration("measure", [0], meas_sched)
 
         sched = schedule(qc, self.backend)
         # Doesn't use the calibrated schedule because the classical memory slots do not match
-        expected = Schedule(macros.measure([0], self.backend, qubit_mem_slots={0: 1}))
+        expected = Schedule(self._meas_q0_mem1)
         self.assertEqual(sched.instructions, expected.instructions)
 
     def test_metadata_is_preserved_alap(self):
         """Test that circuit metadata is preserved in output schedule with alap."""
-        q = QuantumRegister(2)
+        q = self._q2
         qc = QuantumCircuit(q)
         qc.sx(q[0])
         qc.barrier(q[0], q[1])
@@ -1089,7 +1018,7 @@ class TestBasicScheduleV2(QiskitTestCase):
 
     def test_metadata_is_preserved_asap(self):
         """Test that circuit metadata is preserved in output schedule with asap."""
-        q = QuantumRegister(2)
+        q = self._q2
         qc = QuantumCircuit(q)
         qc.sx(q[0])
         qc.barrier(q[0], q[1])
@@ -1118,7 +1047,7 @@ class TestBasicScheduleV2(QiskitTestCase):
             play(Gaussian(duration=160, amp=x, sigma=40), DriveChannel(0))
         qc.add_calibration(gate="pulse_gate", qubits=[0], schedule=expected_schedule, params=[x])
         sched = schedule(qc, self.backend)
-        self.assertEqual(sched, transforms.target_qobj_transform(expected_schedule))
+        self.assertEqual(sched, target_qobj_transform(expected_schedule))
 
     def test_schedule_block_in_instmap(self):
         """Test schedule block in instmap can be scheduled."""
@@ -15,6 +15,7 @@
 """Utility script to update fake backends"""
 
 import argparse
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 import json
 import os
@@ -23,10 +24,22 @@ from qiskit_ibm_provider import IBMProvider
 from qiskit.circuit.parameterexpression import ParameterExpression
 
 
+# Exact-type dispatch for the common leaf values; a single dict probe replaces
+# the isinstance cascade for the bulk of the encoded scalars. Subclasses fall
+# through to the isinstance checks in ``default``.
+_ENCODER_DISPATCH = {
+    complex: lambda o: [o.real, o.imag],  # Use Qobj complex json format
+    datetime: datetime.isoformat,
+}
+
+
 class BackendEncoder(json.JSONEncoder):
     """A json encoder for qobj"""
 
     def default(self, o):
+        fn = _ENCODER_DISPATCH.get(type(o))
+        if fn is not None:
+            return fn(o)
         # Convert numpy arrays:
         if hasattr(o, "tolist"):
             return o.tolist()
@@ -49,6 +62,43 @@ DEFAULT_DIR = os.path.join(
 )
 
 
+def _snapshot_backend(backend, args):
+    """Snapshot a single backend's configuration/properties/defaults to disk."""
+    raw_name = backend.name()
+    if "sim" in raw_name:
+        return
+    if raw_name == "ibmqx2":
+        name = "yorktown"
+    else:
+        name = raw_name.split("_")[1]
+        if name == "16":
+            name = "melbourne"
+    if not args.backends or (name in args.backends or raw_name in args.backends):
+        if not os.path.isdir(os.path.join(args.dir, name)):
+            print("Skipping, fake backend for %s does not exist yet" % name)
+            return
+        config = backend.configuration()
+        props = backend.properties()
+        defs = backend.defaults()
+        # Stream the encoder output straight into a generously buffered file
+        # instead of materializing the full payload as a string first; pulse
+        # defaults for large devices run to megabytes of sample data.
+        if config:
+            config_path = os.path.join(args.dir, name, "conf_%s.json" % name)
+            config_dict = config.to_dict()
+
+            with open(config_path, "w", buffering=1 << 20) as fd:
+                json.dump(config_dict, fd, cls=BackendEncoder)
+        if props:
+            props_path = os.path.join(args.dir, name, "props_%s.json" % name)
+            with open(props_path, "w", buffering=1 << 20) as fd:
+                json.dump(props.to_dict(), fd, cls=BackendEncoder)
+        if defs:
+            defs_path = os.path.join(args.dir, name, "defs_%s.json" % name)
+            with open(defs_path, "w", buffering=1 << 20) as fd:
+                json.dump(defs.to_dict(), fd, cls=BackendEncoder)
+
+
 def _main():
     parser = argparse.ArgumentParser(description="Generate fake backend snapshots")
     parser.add_argument("--dir", "-d", type=str, default=DEFAULT_DIR)
@@ -59,37 +109,10 @@ def _main():
     args = parser.parse_args()
     provider = IBMProvider()
     ibmq_backends = provider.backends()
-    for backend in ibmq_backends:
-        raw_name = backend.name()
-        if "sim" in raw_name:
-            continue
-        if raw_name == "ibmqx2":
-            name = "yorktown"
-        else:
-            name = raw_name.split("_")[1]
-            if name == "16":
-                name = "melbourne"
-        if not args.backends or (name in args.backends or raw_name in args.backends):
-            if not os.path.isdir(os.path.join(args.dir, name)):
-                print("Skipping, fake backend for %s does not exist yet" % name)
-                continue
-            config = backend.configuration()
-            props = backend.properties()
-            defs = backend.defaults()
-            if config:
-                config_path = os.path.join(args.dir, name, "conf_%s.json" % name)
-                config_dict = config.to_dict()
-
-                with open(config_path, "w") as fd:
-                    fd.write(json.dumps(config_dict, cls=BackendEncoder))
-            if props:
-                props_path = os.path.join(args.dir, name, "props_%s.json" % name)
-                with open(props_path, "w") as fd:
-                    fd.write(json.dumps(props.to_dict(), cls=BackendEncoder))
-            if defs:
-                defs_path = os.path.join(args.dir, name, "defs_%s.json" % name)
-                with open(defs_path, "w") as fd:
-                    fd.write(json.dumps(defs.to_dict(), cls=BackendEncoder))
+    # Each backend snapshot is dominated by REST round trips and file writes,
+    # so overlap them with a small thread pool.
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        list(executor.map(lambda backend: _snapshot_backend(backend, args), ibmq_backends))
 
 
 if __name__ == "__main__":